@@ -3,11 +3,25 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
+
+# ``json.dumps`` builds a new encoder on every call once any non-default option
+# is passed; one shared encoder produces identical output without that cost.
+_encode = json.JSONEncoder(ensure_ascii=False).encode
 
 
 def append(path: Path, record: Dict[str, Any]) -> None:
     """Append a JSON record to ``path`` as a JSONL line."""
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("a", encoding="utf-8") as fh:
-        fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+        fh.write(_encode(record) + "\n")
+
+
+def append_many(path: Path, records: Iterable[Dict[str, Any]]) -> None:
+    """Append several JSON records to ``path`` with a single open and write."""
+    lines = "".join(_encode(record) + "\n" for record in records)
+    if not lines:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as fh:
+        fh.write(lines)
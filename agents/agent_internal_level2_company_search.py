@@ -11,23 +11,15 @@ support tickets.
 from __future__ import annotations
 
 import json
-from pathlib import Path
 from typing import Any, Dict, List
 
 from . import company_data
 
-import importlib.util as _ilu
 from datetime import datetime, timezone
 
+from a2a_logging.jsonl_sink import append as append_jsonl
 from config.settings import SETTINGS
 
-_JSONL_PATH = Path(__file__).resolve().parent.parent / "a2a_logging" / "jsonl_sink.py"
-_spec = _ilu.spec_from_file_location("jsonl_sink", _JSONL_PATH)
-_mod = _ilu.module_from_spec(_spec)
-assert _spec and _spec.loader
-_spec.loader.exec_module(_mod)
-append_jsonl = _mod.append
-
 Normalized = Dict[str, Any]
 
 
@@ -41,12 +33,11 @@ def _write_artifact(filename: str, data: Any) -> None:
 
 
 def _log_workflow(record: Dict[str, Any]) -> None:
-    ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H-%M-%S")
-    path = SETTINGS.workflows_dir / f"{ts}_workflow.jsonl"
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    path = SETTINGS.workflows_dir / f"{now.strftime('%Y-%m-%dT%H-%M-%S')}_workflow.jsonl"
     data = dict(record)
-    data.setdefault(
-        "timestamp", datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
-    )
+    if "timestamp" not in data:
+        data["timestamp"] = now.isoformat().replace("+00:00", "Z")
     SETTINGS.workflows_dir.mkdir(parents=True, exist_ok=True)
     append_jsonl(path, data)
 
@@ -5,7 +5,6 @@ from __future__ import annotations
 import time
 from datetime import datetime, time as dtime, timedelta, timezone
 
-import importlib.util as _ilu
 from pathlib import Path
 
 import json
@@ -19,12 +18,7 @@ from agents.templates import build_reminder_email
 from config.settings import SETTINGS
 
 # JSONL logging for reminder notifications
-_JSONL_PATH = Path(__file__).resolve().parents[1] / "a2a_logging" / "jsonl_sink.py"
-_spec = _ilu.spec_from_file_location("jsonl_sink", _JSONL_PATH)
-_mod = _ilu.module_from_spec(_spec)
-assert _spec and _spec.loader
-_spec.loader.exec_module(_mod)  # type: ignore[attr-defined]
-append_jsonl = _mod.append
+from a2a_logging.jsonl_sink import append as append_jsonl
 
 
 def _reminder_log_path() -> Path:
@@ -89,6 +89,12 @@ class Settings:
     google_calendar_ids: List[str] = field(
         default_factory=lambda: _list_env("GOOGLE_CALENDAR_IDS", "primary")
     )
+    cal_debug_event_logging: bool = field(
+        default_factory=lambda: _bool_env("CAL_DEBUG_EVENT_LOGGING", False)
+    )
+    cal_incremental_sync: bool = field(
+        default_factory=lambda: _bool_env("CAL_INCREMENTAL_SYNC", False)
+    )
 
     admin_email: str = field(default_factory=lambda: os.environ.get("ADMIN_EMAIL", ""))
     live_mode: int = field(default_factory=lambda: _int_env("LIVE_MODE", 1))
@@ -155,6 +161,9 @@ class Settings:
 
     openai_api_key: str = field(default_factory=lambda: os.environ.get("OPENAI_API_KEY", ""))
     openai_model: str = field(default_factory=lambda: os.environ.get("OPENAI_MODEL", "gpt-3.5-turbo"))
+    llm_cache_dir: Optional[Path] = field(
+        default_factory=lambda: _optional_path("LLM_CACHE_DIR")
+    )
     hubspot_access_token: str = field(
         default_factory=lambda: os.environ.get("HUBSPOT_ACCESS_TOKEN", "")
     )
@@ -239,6 +248,8 @@ class Settings:
             self.event_db_path = self._resolve_path(self.event_db_path)
         if self.tasks_db_path is not None:
             self.tasks_db_path = self._resolve_path(self.tasks_db_path)
+        if self.llm_cache_dir is not None:
+            self.llm_cache_dir = self._resolve_path(self.llm_cache_dir)
 
     def _resolve_root(self, value: Path) -> Path:
         value = value.expanduser()
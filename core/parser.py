@@ -1,5 +1,10 @@
 import re
-from typing import Optional
+from typing import Dict, Optional
+
+_COMPANY_RE = re.compile(r"(?:firma|company)[:\s]+([^\n]+)", re.IGNORECASE)
+_DOMAIN_RE = re.compile(r"[a-zA-Z0-9.-]+\.[a-z]{2,}")
+_PHONE_RE = re.compile(r"\+?\d[\d\s\/-]{7,}")
+
 
 def extract_company(text: str) -> Optional[str]:
     """Extract a company name using a simple heuristic.
@@ -7,15 +12,35 @@ def extract_company(text: str) -> Optional[str]:
     Looks for patterns like ``Firma <Name>`` or ``Company: <Name>``. This is a
     stub for later NER-based extraction.
     """
-    match = re.search(r"(?:firma|company)[:\s]+([^\n]+)", text, re.IGNORECASE)
+    match = _COMPANY_RE.search(text)
     if match:
         return match.group(1).strip()
     return None
 
 def extract_domain(text: str) -> Optional[str]:
-    match = re.search(r"[a-zA-Z0-9.-]+\.[a-z]{2,}", text)
+    match = _DOMAIN_RE.search(text)
     return match.group(0) if match else None
 
 def extract_phone(text: str) -> Optional[str]:
-    match = re.search(r"\+?\d[\d\s\/-]{7,}", text)
+    match = _PHONE_RE.search(text)
     return match.group(0) if match else None
+
+def extract_all(text: str) -> Dict[str, str]:
+    """Return the ``company``, ``domain`` and ``phone`` found in ``text``.
+
+    Keys without a match are omitted. Each field is the first match of its own
+    precompiled pattern, so results equal the individual ``extract_*`` calls.
+    """
+    fields: Dict[str, str] = {}
+    if not text:
+        return fields
+    company = extract_company(text)
+    if company:
+        fields["company"] = company
+    domain = extract_domain(text)
+    if domain:
+        fields["domain"] = domain
+    phone = extract_phone(text)
+    if phone:
+        fields["phone"] = phone
+    return fields
@@ -41,11 +41,12 @@ def summarize_notes(text: Optional[str], max_length: int = 200) -> str:
 
     # Attempt to extract the first sentence.  This keeps the implementation
     # dependency free while still providing useful behaviour.
+    # ``find`` plus a slice avoids copying the remainder of long notes the way
+    # ``split(sep, 1)`` would.
     for sep in (". ", "! ", "? "):
-        if sep in cleaned:
-            candidate = cleaned.split(sep, 1)[0]
-            if len(candidate) <= max_length:
-                return candidate.strip()
+        idx = cleaned.find(sep)
+        if idx != -1 and idx <= max_length:
+            return cleaned[:idx].strip()
 
     # Fallback: simple truncation with ellipsis when the text is very long.
     if len(cleaned) > max_length:
@@ -1,10 +1,14 @@
+import hashlib
+import json
 import logging
 import os
 import re
+import sys
+import time
 from pathlib import Path
 from difflib import SequenceMatcher
 from functools import lru_cache
-from typing import Iterable, List, Optional, Tuple
+from typing import Any, Iterable, List, Optional, Tuple
 
 from core.utils import normalize_text as _normalize_text
 from config.settings import SETTINGS
@@ -21,8 +25,24 @@ except Exception:  # pragma: no cover - openai not installed
 
 openai = _openai
 
+try:  # Optional Aho-Corasick matcher for the default trigger list
+    import ahocorasick as _ahocorasick  # type: ignore
+except Exception:  # pragma: no cover - pyahocorasick not installed
+    _ahocorasick = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
+_LLM_MODEL = "gpt-4o-mini"
+# Bump _PROMPT_VERSION whenever _PROMPT_TEMPLATE changes so cached answers are
+# not reused.
+_PROMPT_VERSION = "v1"
+_PROMPT_TEMPLATE = (
+    "Extract the company name from the calendar event title below. "
+    "Ignore words like 'Firma', 'Company', 'Client'. "
+    'Return only the plain company name, no quotes. If none, return "Unknown".\n\n'
+    'Title: "{title}"'
+)
+
 # Built-in fallback triggers, used only when the external file is missing
 TRIGGERS: List[str] = [
     "research",
@@ -51,24 +71,32 @@ def normalize_text(text: str) -> str:
     return _normalize_text(text)
 
 
-@lru_cache(maxsize=1)
-def load_trigger_words() -> List[str]:
-    """Load trigger words from ``config/trigger_words.txt`` and expand variants."""
-    path_obj: Path
+def _trigger_words_file() -> Path:
+    """Resolve the trigger words file, guarding against path traversal."""
+    default = Path(__file__).resolve().parent.parent / "config" / "trigger_words.txt"
     if SETTINGS.trigger_words_path is None:
-        path_obj = Path(__file__).resolve().parent.parent / "config" / "trigger_words.txt"
-    else:
-        try:
-            path_obj = SETTINGS.trigger_words_path.resolve()
-        except (OSError, ValueError) as exc:
-            logger.warning("Invalid trigger words path %s: %s", SETTINGS.trigger_words_path, exc)
-            path_obj = Path(__file__).resolve().parent.parent / "config" / "trigger_words.txt"
-        else:
-            project_root = Path(__file__).resolve().parent.parent
-            project_root_str = str(project_root) + os.sep
-            if not str(path_obj).startswith(project_root_str):
-                logger.warning("Path traversal attempt blocked: %s", path_obj)
-                path_obj = project_root / "config" / "trigger_words.txt"
+        return default
+    try:
+        path_obj = SETTINGS.trigger_words_path.resolve()
+    except (OSError, ValueError) as exc:
+        logger.warning("Invalid trigger words path %s: %s", SETTINGS.trigger_words_path, exc)
+        return default
+    project_root = Path(__file__).resolve().parent.parent
+    project_root_str = str(project_root) + os.sep
+    if not str(path_obj).startswith(project_root_str):
+        logger.warning("Path traversal attempt blocked: %s", path_obj)
+        return default
+    return path_obj
+
+
+@lru_cache(maxsize=1)
+def load_trigger_words() -> Tuple[str, ...]:
+    """Load trigger words from ``config/trigger_words.txt`` and expand variants.
+
+    The result is cached, so it is returned as a tuple that callers cannot
+    mutate behind the cache's back.
+    """
+    path_obj = _trigger_words_file()
 
     words: List[str] = []
     if path_obj.exists():  # pragma: no cover - trivial file IO
@@ -87,7 +115,7 @@ def load_trigger_words() -> List[str]:
         variants.add(w.replace(" ", "-"))
         variants.add(w.replace(" ", ""))
         variants.add(w.replace("-", ""))
-    return sorted(variants)
+    return tuple(sorted(variants))
 
 
 def _levenshtein_leq1(a: str, b: str) -> bool:
@@ -134,10 +162,100 @@ def _hybrid_match(word: str, trigger: str) -> bool:
     return _levenshtein_leq1(word, trigger) or _fuzzy_match(word, trigger)
 
 
-@lru_cache(maxsize=128)
-def _get_normalized_triggers() -> List[str]:
-    """Cache normalized trigger words for better performance."""
-    return [normalize_text(trig) for trig in load_trigger_words()]
+@lru_cache(maxsize=1)
+def _get_normalized_triggers() -> Tuple[str, ...]:
+    """Cache normalized, de-duplicated and interned trigger words."""
+    return tuple(
+        dict.fromkeys(sys.intern(normalize_text(trig)) for trig in load_trigger_words())
+    )
+
+
+@lru_cache(maxsize=4)
+def _normalized_pairs(words: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+    """Pair each trigger word with its normalized form.
+
+    Keyed on the loaded word tuple, so a reloaded trigger list is normalized
+    once and never served stale.
+    """
+    return tuple((trig, normalize_text(trig)) for trig in words)
+
+
+_TRIGGER_FILE_STAMP: Optional[Tuple[str, Optional[int]]] = None
+
+
+def reload_trigger_words_if_changed() -> None:
+    """Drop cached trigger words when the trigger words file changed.
+
+    Intended to be called once per polling cycle so edits to the file are
+    picked up without restarting, while individual checks stay cache hits.
+    """
+    global _TRIGGER_FILE_STAMP
+    path_obj = _trigger_words_file()
+    try:
+        mtime: Optional[int] = path_obj.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    stamp = (str(path_obj), mtime)
+    if _TRIGGER_FILE_STAMP is not None and _TRIGGER_FILE_STAMP != stamp:
+        load_trigger_words.cache_clear()
+        _get_normalized_triggers.cache_clear()
+    _TRIGGER_FILE_STAMP = stamp
+
+
+_WORD_CHAR_RE = re.compile(r"\w")
+
+
+def _at_boundary(text: str, idx: int) -> bool:
+    """Return ``True`` when ``idx`` sits on a ``\\b`` word boundary in ``text``."""
+    before = idx > 0 and _WORD_CHAR_RE.match(text, idx - 1) is not None
+    after = idx < len(text) and _WORD_CHAR_RE.match(text, idx) is not None
+    return before != after
+
+
+@lru_cache(maxsize=8)
+def _trigger_automaton(norm_triggers: Tuple[str, ...]):
+    """Build an Aho-Corasick automaton over ``norm_triggers``.
+
+    Returns ``None`` when ``pyahocorasick`` is unavailable or the list is empty
+    so callers fall back to per-trigger regex scanning.
+    """
+    if _ahocorasick is None or not norm_triggers:
+        return None
+    automaton = _ahocorasick.Automaton()
+    for norm_trig in norm_triggers:
+        if norm_trig:
+            automaton.add_word(norm_trig, norm_trig)
+    if not len(automaton):
+        return None
+    automaton.make_automaton()
+    return automaton
+
+
+@lru_cache(maxsize=8)
+def _trigger_pattern(norm_triggers: Tuple[str, ...]) -> Optional[re.Pattern[str]]:
+    """Compile ``norm_triggers`` into one word-bounded alternation.
+
+    Used when ``pyahocorasick`` is unavailable: a single C-level scan instead of
+    one ``re.search`` per trigger.
+    """
+    alternatives = [re.escape(norm_trig) for norm_trig in norm_triggers if norm_trig]
+    if not alternatives:
+        return None
+    return re.compile(rf"\b(?:{'|'.join(alternatives)})\b")
+
+
+def _exact_match(norm: str, norm_triggers: Tuple[str, ...]) -> bool:
+    """Return ``True`` when any trigger occurs in ``norm`` on word boundaries."""
+    automaton = _trigger_automaton(norm_triggers)
+    if automaton is None:
+        pattern = _trigger_pattern(norm_triggers)
+        return pattern is not None and pattern.search(norm) is not None
+    for end, norm_trig in automaton.iter(norm):
+        start = end - len(norm_trig) + 1
+        if _at_boundary(norm, start) and _at_boundary(norm, end + 1):
+            return True
+    return False
+
 
 def contains_trigger(
     text: str | dict, triggers: Optional[Iterable[str]] = None
@@ -170,11 +288,10 @@ def contains_trigger(
     # Use cached normalized triggers if no custom triggers provided
     if triggers is None:
         norm_triggers = _get_normalized_triggers()
-        # Fast exact match check first
-        for norm_trig in norm_triggers:
-            if re.search(rf"\b{re.escape(norm_trig)}\b", norm):
-                return True
-        
+        # Fast exact match check first: one pass over the text
+        if _exact_match(norm, norm_triggers):
+            return True
+
         # Only do expensive fuzzy matching if no exact matches
         words = re.findall(r"\b\w+\b", norm)
         for norm_trig in norm_triggers:
@@ -210,11 +327,20 @@ def suggest_similar(
     norm = normalize_text(text)
     words = re.findall(r"\b\w+\b", norm)
     candidates: List[Tuple[float, str]] = []
-    for trig in load_trigger_words():
-        norm_trig = normalize_text(trig)
+    # SequenceMatcher caches its analysis of the second sequence, so the
+    # trigger goes there and one matcher is reused per trigger.
+    matcher = SequenceMatcher(None)
+    for trig, norm_trig in _normalized_pairs(load_trigger_words()):
+        matcher.set_seq2(norm_trig)
         best = 0.0
         for w in words:
-            score = SequenceMatcher(None, w, norm_trig).ratio()
+            matcher.set_seq1(w)
+            # The quick ratios are upper bounds of ratio(); words that cannot
+            # reach the threshold or beat ``best`` skip the full comparison.
+            floor = best if best > threshold else threshold
+            if matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor:
+                continue
+            score = matcher.ratio()
             if score > best:
                 best = score
         if best >= threshold:
@@ -251,29 +377,74 @@ def extract_company(title: str, trigger: str) -> str:
         return remainder
 
     if openai is not None:  # pragma: no cover - requires network
-        prompt = (
-            "Extract the company name from the calendar event title below. "
-            "Ignore words like 'Firma', 'Company', 'Client'. "
-            'Return only the plain company name, no quotes. If none, return "Unknown".\n\n'
-            f'Title: "{title}"'
-        )
         try:
-            client = openai.OpenAI()
-            resp = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0,
-            )
-            text = resp.choices[0].message.content.strip() if resp.choices[0].message.content else "Unknown"
-            return text or "Unknown"
+            return _extract_company_ai(title)
         except Exception:  # pragma: no cover - defensive
             return "Unknown"
     return "Unknown"
 
 
+def _llm_cache_path(title: str) -> Optional[Path]:
+    """Return the on-disk cache entry for ``title`` when ``LLM_CACHE_DIR`` is set."""
+    if SETTINGS.llm_cache_dir is None:
+        return None
+    key = hashlib.sha256(f"{_LLM_MODEL}|{_PROMPT_VERSION}|{title}".encode("utf-8")).hexdigest()
+    return SETTINGS.llm_cache_dir / f"{key}.json"
+
+
+@lru_cache(maxsize=1)
+def _openai_client(module: Any) -> Any:
+    """Return one client per ``openai`` module so its connection pool is reused."""
+    return module.OpenAI(api_key=SETTINGS.openai_api_key)
+
+
+@lru_cache(maxsize=4096)
+def _extract_company_ai(title: str) -> str:
+    """Ask the LLM for the company in ``title``, memoized per title.
+
+    Recurring events repeat the same title, so answers are kept in memory and,
+    when ``LLM_CACHE_DIR`` is configured, on disk across runs. Failures raise
+    so they are never cached.
+    """
+    cache_path = _llm_cache_path(title)
+    if cache_path is not None and cache_path.exists():
+        try:
+            return json.loads(cache_path.read_text(encoding="utf-8"))["company"]
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("Ignoring unreadable LLM cache entry %s: %s", cache_path, exc)
+
+    prompt = _PROMPT_TEMPLATE.format(title=title)
+    resp = _openai_client(openai).chat.completions.create(
+        model=_LLM_MODEL,
+        messages=[{"role": "user", "content": prompt}],
+        temperature=0,
+    )
+    text = resp.choices[0].message.content.strip() if resp.choices[0].message.content else "Unknown"
+    company = text or "Unknown"
+
+    if cache_path is not None:
+        record = {
+            "timestamp": time.time(),
+            "model": _LLM_MODEL,
+            "prompt_version": _PROMPT_VERSION,
+            "title": title,
+            "company": company,
+        }
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(record, ensure_ascii=False), encoding="utf-8")
+            # Concurrent runs never observe a half-written entry.
+            os.replace(tmp_path, cache_path)
+        except OSError as exc:
+            logger.warning("Failed to write LLM cache entry %s: %s", cache_path, exc)
+    return company
+
+
 __all__ = [
     "normalize_text",
     "load_trigger_words",
+    "reload_trigger_words_if_changed",
     "contains_trigger",
     "suggest_similar",
     "extract_company",
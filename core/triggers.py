@@ -89,8 +89,12 @@ def gather_calendar_triggers(
 
         log_event = default_log_event
     if contains_trigger is None:
-        from core.trigger_words import contains_trigger as default_contains_trigger
+        from core.trigger_words import (
+            contains_trigger as default_contains_trigger,
+            reload_trigger_words_if_changed,
+        )
 
+        reload_trigger_words_if_changed()
         contains_trigger = default_contains_trigger
     if get_workflow_id is None:
         from core.utils import get_workflow_id as default_get_workflow_id
@@ -145,11 +149,13 @@ def gather_calendar_triggers(
     log_step("calendar", "fetch_return", {"count": len(events)})
 
     triggers: List[Dict[str, Any]] = []
+    add_trigger = triggers.append
+    not_relevant = statuses.NOT_RELEVANT
     for event in events:
-        payload = event.get("payload") or event
         event_id = _calendar_event_identifier(event)
         trigger = _as_trigger_from_event(event, contains_trigger=contains_trigger)
         if trigger is None:
+            payload = event.get("payload") or event
             log_step(
                 "calendar",
                 "event_discarded",
@@ -162,7 +168,7 @@ def gather_calendar_triggers(
                 },
             )
             if event_id:
-                log_event({"event_id": event_id, "status": statuses.NOT_RELEVANT})
+                log_event({"event_id": event_id, "status": not_relevant})
             continue
         log_step(
             "calendar",
@@ -170,11 +176,11 @@ def gather_calendar_triggers(
             {
                 "event": {
                     "id": event_id,
-                    "summary": payload.get("summary", ""),
+                    "summary": trigger["payload"].get("summary", ""),
                 }
             },
         )
-        triggers.append(trigger)
+        add_trigger(trigger)
     return triggers
 
 
@@ -18,22 +18,18 @@ from datetime import datetime, timezone
 from functools import lru_cache
 from logging import getLogger
 from pathlib import Path
-from typing import Any, Dict, List
-import importlib.util as _ilu
+from typing import Any, Dict, Iterator, List
 import glob
 import shutil
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
 
+from a2a_logging.jsonl_sink import append as append_jsonl, append_many as append_jsonl_many
 from config.settings import SETTINGS
 
 VARIANT = "v2"
 
-_JSONL_PATH = Path(__file__).resolve().parents[1] / "a2a_logging" / "jsonl_sink.py"
-_spec = _ilu.spec_from_file_location("jsonl_sink", _JSONL_PATH)
-_mod = _ilu.module_from_spec(_spec)
-assert _spec and _spec.loader
-_spec.loader.exec_module(_mod)
-append_jsonl = _mod.append
-
 WORKFLOW_ID: str | None = None
 SUMMARY: Dict[str, int] = {}
 
@@ -75,6 +71,42 @@ def _update_summary(source: str, stage: str, severity: str) -> None:
         SUMMARY["warnings"] += 1
 
 
+# Records collected by ``buffered_log_steps`` per target file; ``None`` while
+# log_step writes straight through. Scoped to the current context, so other
+# threads keep writing immediately; worker threads join a buffer by running in
+# a copy of the caller's context (``contextvars.copy_context``).
+_LOG_BUFFER: ContextVar[Dict[Path, List[Dict[str, Any]]] | None] = ContextVar(
+    "log_step_buffer", default=None
+)
+_LOG_BUFFER_LOCK = threading.Lock()
+
+
+@contextmanager
+def buffered_log_steps() -> Iterator[None]:
+    """Collect :func:`log_step` records and write each file once on exit.
+
+    Hot loops emitting one record per item otherwise reopen the JSONL file for
+    every line. Nested blocks flush when the outermost one exits.
+    """
+    if _LOG_BUFFER.get() is not None:
+        yield
+        return
+    buffer: Dict[Path, List[Dict[str, Any]]] = {}
+    reset_token = _LOG_BUFFER.set(buffer)
+    try:
+        yield
+    finally:
+        _LOG_BUFFER.reset(reset_token)
+        with _LOG_BUFFER_LOCK:
+            pending = dict(buffer)
+            buffer.clear()
+        for path, records in pending.items():
+            try:
+                append_jsonl_many(path, records)
+            except (OSError, IOError, ValueError) as e:  # pragma: no cover - logging shouldn't break tests
+                getLogger(__name__).warning("Logging failed: %s", e)
+
+
 def log_step(source: str, stage: str, data: Dict[str, Any], *, severity: str = "info") -> None:
     payload = {
         "workflow_id": get_workflow_id(),
@@ -84,9 +116,16 @@ def log_step(source: str, stage: str, data: Dict[str, Any], *, severity: str = "
         "variant": VARIANT,
     }
     payload.update(data)
+    path = SETTINGS.workflows_dir / f"{source}.jsonl"
+    buffer = _LOG_BUFFER.get()
+    if buffer is not None:
+        with _LOG_BUFFER_LOCK:
+            buffer.setdefault(path, []).append(payload)
+        _update_summary(source, stage, severity)
+        return
     try:
         SETTINGS.workflows_dir.mkdir(parents=True, exist_ok=True)
-        append_jsonl(SETTINGS.workflows_dir / f"{source}.jsonl", payload)
+        append_jsonl(path, payload)
     except (OSError, IOError, ValueError) as e:  # pragma: no cover - logging shouldn't break tests
         getLogger(__name__).warning("Logging failed: %s", e)
     else:
@@ -195,6 +234,10 @@ _NORMALIZE_TRANSLATION = str.maketrans({
 def normalize_text(text: str) -> str:
     if not text:
         return ""
+    # NFKC and the translation table only affect non-ASCII characters, so
+    # plain ASCII text (most event titles) just needs lowercasing.
+    if text.isascii():
+        return text.lower()
     # Unicode normalisieren (Gedankenstrich etc. angleichen)
     text = unicodedata.normalize("NFKC", text)
     # Alles klein
@@ -130,6 +130,7 @@ def _decode(value: str) -> str:
 _MESSAGE_ID_PATTERN = re.compile(r"<[^>]+>")
 _TASK_ID_PATTERN = re.compile(r"Task ([A-Fa-f0-9-]{36})")
 _EVENT_ID_PATTERN = re.compile(r"Event (\d{4}-\d{2}-\d{2})_(\d{4})")
+_EMAIL_PATTERN = re.compile(r"[\w.%-]+@[\w.-]+")
 
 
 def _header_message_ids(msg: Message) -> List[str]:
@@ -332,17 +333,8 @@ def fetch_replies() -> List[Dict[str, Any]]:
             except Exception:
                 body = ""
 
-        fields: Dict[str, Any] = {}
-        company = parser.extract_company(body)
-        if company:
-            fields["company"] = company
-        domain = parser.extract_domain(body)
-        if domain:
-            fields["domain"] = domain
-        phone = parser.extract_phone(body)
-        if phone:
-            fields["phone"] = phone
-        mail_match = re.search(r"[\w.%-]+@[\w.-]+", body)
+        fields: Dict[str, Any] = parser.extract_all(body)
+        mail_match = _EMAIL_PATTERN.search(body)
         if mail_match:
             fields["email"] = mail_match.group(0)
 
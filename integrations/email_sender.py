@@ -437,6 +437,9 @@ def send_missing_fields_reminder(
     )
 
 
+_OPTIONAL_REMINDER_LINES = "Email:\nPhone:"
+
+
 def send_reminder(
     *,
     to: str,
@@ -457,6 +460,18 @@ def send_reminder(
     content remains friendly and lists required and optional fields.
     """
 
+    # Skipped reminders return before any subject/body formatting.
+    # Allow reminders only for a configured company domain (optional)
+    allow = SETTINGS.allowlist_email_domain
+    if allow and not to.lower().endswith(f"@{allow.lower()}"):
+        log_step(
+            "mailer",
+            "reminder_skipped_invalid_domain",
+            {"to": to},
+            severity="warning",
+        )
+        return
+
     start_s = event_start.strftime("%Y-%m-%d, %H:%M") if event_start else ""
     end_s = event_end.strftime("%H:%M") if event_end else ""
 
@@ -468,7 +483,6 @@ def send_reminder(
         subject += f" – Task {task_id}"
 
     req_lines = "\n".join(f"{f}:" for f in missing_fields)
-    opt_lines = "\n".join(f"{f}:" for f in ["Email", "Phone"])
 
     greeting = f"Hi {creator_name}," if creator_name else f"Hi {creator_email},"
 
@@ -482,7 +496,7 @@ I definitely need the following details (required):
 {req_lines}
 
 If you also have these details, please include them (optional):
-{opt_lines}
+{_OPTIONAL_REMINDER_LINES}
 
 Please reply to this email directly with the missing information.
 You might also update the calendar entry or contact record with these details.
@@ -494,16 +508,6 @@ Thanks a lot for your support!
 "Your Internal Research Agent"
 """
 
-    # Allow reminders only for a configured company domain (optional)
-    allow = SETTINGS.allowlist_email_domain
-    if allow and not to.lower().endswith(f"@{allow.lower()}"):
-        log_step(
-            "mailer",
-            "reminder_skipped_invalid_domain",
-            {"to": to},
-            severity="warning",
-        )
-        return
     send(
         to=to,
         subject=subject,
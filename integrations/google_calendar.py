@@ -1,19 +1,24 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import os
 import time
+import contextvars
 import datetime as dt
+import json
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterator, List, TypeVar
 
 from config.settings import SETTINGS
-from core.utils import log_step
+from core.utils import buffered_log_steps, log_step
 from .google_oauth import (
     build_user_credentials,
     classify_oauth_error,
-    refresh_access_token,
+    refresh_access_token_with_expiry,
     OAuthError,
 )
 from app.core.policy.retry import MAX_ATTEMPTS, backoff_seconds
@@ -26,6 +31,7 @@ except Exception:
     build = None
 
 Normalized = Dict[str, Any]
+T = TypeVar("T")
 
 SCOPES = ["https://www.googleapis.com/auth/calendar.readonly"]
 
@@ -34,19 +40,47 @@ LOOKAHEAD_DAYS = SETTINGS.cal_lookahead_days
 LOOKBACK_DAYS = SETTINGS.cal_lookback_days
 CAL_IDS: List[str] = SETTINGS.google_calendar_ids or ["primary"]
 
+# Upper bound for concurrent per-calendar fetches.
+_MAX_FETCH_WORKERS = 8
+# Calendar API limit for calls in a single batch HTTP request.
+_BATCH_LIMIT = 50
+# Partial response: only what ``_normalize``/``_in_window`` read, plus paging.
+_EVENT_FIELDS = (
+    "items(id,status,summary,description,location,attendees/email,"
+    "start,end,creator,organizer),nextPageToken,nextSyncToken"
+)
 
-def _time_window() -> tuple[str, str]:
-    now = dt.datetime.utcnow().replace(tzinfo=dt.timezone.utc)
-    tmin = now - dt.timedelta(days=LOOKBACK_DAYS)
-    tmax = now + dt.timedelta(days=LOOKAHEAD_DAYS)
+
+@lru_cache(maxsize=16)
+def _time_window_cached(epoch_minute: int, lookback: int, lookahead: int) -> tuple[str, str]:
+    now = dt.datetime.now(dt.timezone.utc)
+    tmin = now - dt.timedelta(days=lookback)
+    tmax = now + dt.timedelta(days=lookahead)
     return tmin.isoformat(), tmax.isoformat()
 
 
+def _time_window() -> tuple[str, str]:
+    # Polls within the same minute reuse the formatted window bounds.
+    epoch_minute = int(time.time() // 60)
+    return _time_window_cached(epoch_minute, LOOKBACK_DAYS, LOOKAHEAD_DAYS)
+
+
 def _normalize(ev: Dict[str, Any], cal_id: str) -> Normalized:
     summary = ev.get("summary") or ""
     description = ev.get("description") or ""
-    company = extract_company(summary) or extract_company(description)
-    domain = extract_domain(summary) or extract_domain(description)
+    # One scan over both fields; leftmost-match keeps summary hits first. The
+    # blank line stops COMPANY_REGEX from joining a summary tail to a legal
+    # form at the start of the description.
+    if description:
+        text = f"{summary}\n\n{description}" if summary else description
+    else:
+        text = summary
+    # Blank events (focus time, OOO) skip extraction entirely.
+    company = extract_company(text) if text else None
+    domain = extract_domain(text) if text else None
+    # Look creator/organizer up once and skip the throwaway ``{}`` on misses.
+    creator = ev.get("creator")
+    organizer = ev.get("organizer")
     return {
         "event_id": ev.get("id"),
         "summary": summary or None,
@@ -54,15 +88,15 @@ def _normalize(ev: Dict[str, Any], cal_id: str) -> Normalized:
         "location": ev.get("location"),
         "attendees": [
             {"email": a.get("email")}
-            for a in ev.get("attendees", []) or []
+            for a in ev.get("attendees") or ()
             if isinstance(a, dict)
         ],
         "start": ev.get("start"),
         "end": ev.get("end"),
-        "creatorEmail": (ev.get("creator") or {}).get("email"),
-        "creator": ev.get("creator"),
-        "organizer": ev.get("organizer"),
-        "organizerEmail": (ev.get("organizer") or {}).get("email"),
+        "creatorEmail": creator.get("email") if creator else None,
+        "creator": creator,
+        "organizer": organizer,
+        "organizerEmail": organizer.get("email") if organizer else None,
         "calendarId": cal_id,
         "company_name": company,
         "domain": domain,
@@ -71,48 +105,504 @@ def _normalize(ev: Dict[str, Any], cal_id: str) -> Normalized:
 
 COMPANY_REGEX = r"\b([A-Z][A-Za-z0-9&.\- ]{2,}\s(?:GmbH|AG|KG|SE|Ltd|Inc|LLC))\b"
 DOMAIN_REGEX = r"\b([a-z0-9\-]+\.[a-z]{2,})(/[\S]*)?\b"
+_COMPANY_RE = re.compile(COMPANY_REGEX)
+_DOMAIN_RE = re.compile(DOMAIN_REGEX)
 
 
-def contains_trigger(text: str) -> bool:
-    if not text:
-        return False
-    text_lower = text.lower()
-    trigger_words_file = SETTINGS.trigger_words_path or Path("config/trigger_words.txt")
+_FALLBACK_TRIGGER_WORDS = ("research", "recherche", "meeting preparation", "besuchsvorbereitung")
+
+
+@lru_cache(maxsize=4)
+def _trigger_regex(trigger_words_file: str, mtime_ns: int | None) -> re.Pattern[str] | None:
+    """Compile the trigger words in ``trigger_words_file`` into one pattern.
+
+    ``mtime_ns`` is part of the cache key only, so an edited file is re-read.
+    """
     try:
         with Path(trigger_words_file).open('r', encoding='utf-8') as f:
-            trigger_words = [line.strip().lower() for line in f if line.strip()]
-        return any(word in text_lower for word in trigger_words)
+            trigger_words = tuple(line.strip() for line in f if line.strip())
     except (OSError, IOError):
         # Fallback to hardcoded trigger words if file not found
-        fallback_words = ["research", "recherche", "meeting preparation", "besuchsvorbereitung"]
-        return any(word in text_lower for word in fallback_words)
+        trigger_words = _FALLBACK_TRIGGER_WORDS
+    if not trigger_words:
+        return None
+    return re.compile("|".join(re.escape(w) for w in trigger_words), re.IGNORECASE)
 
 
-def extract_company(text: str) -> str | None:
+def contains_trigger(text: str) -> bool:
     if not text:
-        return None
-    m = re.search(COMPANY_REGEX, text)
+        return False
+    trigger_words_file = SETTINGS.trigger_words_path or Path("config/trigger_words.txt")
+    try:
+        mtime_ns: int | None = os.stat(trigger_words_file).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    pattern = _trigger_regex(str(trigger_words_file), mtime_ns)
+    return pattern is not None and pattern.search(text) is not None
+
+
+# Texts longer than this are scanned directly instead of being memoized so the
+# caches cannot pin large event descriptions in memory.
+_EXTRACT_CACHE_MAX_LEN = 2048
+
+# Every company match ends in one of these legal-form suffixes; texts without
+# any of them cannot match ``COMPANY_REGEX`` and skip the regex entirely.
+_COMPANY_SUFFIXES = ("GmbH", "AG", "KG", "SE", "Ltd", "Inc", "LLC")
+
+
+def _search_company(text: str) -> str | None:
+    m = _COMPANY_RE.search(text)
     if m:
         return m.group(1)
     return None
 
 
-def extract_domain(text: str) -> str | None:
-    if not text:
-        return None
-    m = re.search(DOMAIN_REGEX, text)
+def _search_domain(text: str) -> str | None:
+    m = _DOMAIN_RE.search(text)
     if m:
         return m.group(1).lower()
     return None
 
 
-def fetch_events() -> List[Normalized]:
-    results: List[Normalized] = []
+# Recurring events repeat the same summary/description, so memoize the scans.
+_extract_company_cached = lru_cache(maxsize=1024)(_search_company)
+_extract_domain_cached = lru_cache(maxsize=1024)(_search_domain)
+
+
+def extract_company(text: str) -> str | None:
+    if not text or not any(s in text for s in _COMPANY_SUFFIXES):
+        return None
+    if len(text) < _EXTRACT_CACHE_MAX_LEN:
+        return _extract_company_cached(text)
+    return _search_company(text)
+
+
+def extract_domain(text: str) -> str | None:
+    if not text or "." not in text:
+        return None
+    if len(text) < _EXTRACT_CACHE_MAX_LEN:
+        return _extract_domain_cached(text)
+    return _search_domain(text)
+
+
+def _backoff_schedule() -> Iterator[float]:
+    """Yield the delay before each retry; jitter is drawn per schedule."""
+    for attempt in range(1, MAX_ATTEMPTS):
+        yield backoff_seconds(attempt)
+
+
+def _http_status(exc: Exception) -> int | None:
+    """Return the HTTP status of a googleapiclient ``HttpError``, if any."""
+    return getattr(getattr(exc, "resp", None), "status", None)
+
+
+def _with_retry(call: Callable[[], T], stage: str, context: Dict[str, Any]) -> T:
+    """Run ``call`` under the shared retry policy, logging ``stage`` per retry."""
+    delays = _backoff_schedule()
+    attempt = 1
+    while True:
+        try:
+            return call()
+        except Exception as exc:
+            # 410 Gone (expired sync token) is final; callers fall back to a full sync.
+            delay = None if _http_status(exc) == 410 else next(delays, None)
+            if delay is None:
+                raise
+            log_step(
+                "calendar",
+                stage,
+                {
+                    **context,
+                    "attempt": attempt,
+                    "backoff_seconds": round(delay, 2),
+                    "error": str(exc),
+                },
+                severity="warning",
+            )
+            time.sleep(delay)
+            attempt += 1
+
+
+def _build_service(creds: Any) -> Any:
+    return build("calendar", "v3", credentials=creds, cache_discovery=False)
+
+
+# Authorized service reused across polls so the discovery document is parsed
+# once. Keyed by the OAuth client and refresh token it was built for.
+_SERVICE_CACHE: Dict[str, Any] = {}
+
+
+def _cached_service(creds: Any) -> tuple[Any, Any]:
+    """Return ``(creds, service)``, reusing the previous poll's service.
+
+    The returned credentials are the ones bound to the service; callers set
+    fresh access tokens on them rather than on ``creds``.
+    """
+    key = (SETTINGS.google_client_id, SETTINGS.google_refresh_token)
+    if _SERVICE_CACHE.get("key") != key:
+        _SERVICE_CACHE.clear()
+        _SERVICE_CACHE.update(key=key, creds=creds, service=_build_service(creds))
+    return _SERVICE_CACHE["creds"], _SERVICE_CACHE["service"]
+
+
+# Worker threads outlive a single poll so their services, and the keep-alive
+# connections held by each httplib2 transport, are reused by later polls.
+_FETCH_POOL: ThreadPoolExecutor | None = None
+_WORKER_LOCAL = threading.local()
+
+
+def _fetch_pool() -> ThreadPoolExecutor:
+    global _FETCH_POOL
+    if _FETCH_POOL is None:
+        _FETCH_POOL = ThreadPoolExecutor(
+            max_workers=_MAX_FETCH_WORKERS, thread_name_prefix="calendar-fetch"
+        )
+    return _FETCH_POOL
+
+
+def _worker_service(creds: Any) -> Any:
+    """Return the calling thread's service for ``creds``, built once per thread."""
+    cached = getattr(_WORKER_LOCAL, "service", None)
+    if cached is None or cached[0] is not creds:
+        cached = (creds, _build_service(creds))
+        _WORKER_LOCAL.service = cached
+    return cached[1]
+
+
+def _execute_batch(service: Any, requests: List[Any]) -> List[tuple[Any, Exception | None]]:
+    """Execute ``requests`` as batch HTTP requests, preserving their order."""
+    results: List[tuple[Any, Exception | None]] = [(None, None)] * len(requests)
+
+    def _on_response(request_id: str, response: Any, exception: Exception | None) -> None:
+        results[int(request_id)] = (response, exception)
+
+    for start in range(0, len(requests), _BATCH_LIMIT):
+        batch = service.new_batch_http_request(callback=_on_response)
+        for idx in range(start, min(start + _BATCH_LIMIT, len(requests))):
+            batch.add(requests[idx], request_id=str(idx))
+        batch.execute()
+    return results
+
+
+# 403 reasons that are quota throttling rather than a missing permission.
+_RATE_LIMIT_REASONS = ("rateLimitExceeded", "userRateLimitExceeded", "quotaExceeded")
+
+
+def _is_definitive_failure(exc: Exception) -> bool:
+    """Return ``True`` when retrying cannot make the calendar reachable."""
+    status = _http_status(exc)
+    if status == 404:
+        return True
+    if status == 403:
+        message = str(exc)
+        return not any(reason in message for reason in _RATE_LIMIT_REASONS)
+    return False
+
+
+def _probe_calendars(service: Any, cal_ids: List[str]) -> Dict[str, Exception]:
+    """Probe all ``cal_ids`` in one batch request and return the unreachable ones.
+
+    Only definitive failures (not found, forbidden) are returned; calendars
+    whose part failed transiently (429, 5xx) are fetched with the regular
+    retry policy. ``calendars().get`` succeeds for every readable calendar,
+    whereas ``calendarList().get`` 404s for shared or resource calendars the
+    user has not added to their list.
+    """
+    responses = _execute_batch(
+        service, [service.calendars().get(calendarId=cal_id) for cal_id in cal_ids]
+    )
+    return {
+        cal_id: exc
+        for cal_id, (_, exc) in zip(cal_ids, responses)
+        if exc is not None and _is_definitive_failure(exc)
+    }
+
+
+def _sync_state_path() -> Path:
+    return SETTINGS.workflows_dir / "calendar_sync.json"
+
+
+def _str_map(value: Any) -> Dict[str, str]:
+    if not isinstance(value, dict):
+        return {}
+    return {k: v for k, v in value.items() if isinstance(k, str) and isinstance(v, str) and v}
+
+
+def _load_sync_state() -> tuple[Dict[str, str], Dict[str, str]]:
+    """Return the stored ``nextSyncToken`` and window horizon per calendar id.
+
+    The horizon is the ``timeMax`` the calendar was last synced up to. Files
+    from before horizons were recorded hold the tokens only.
+    """
+    path = _sync_state_path()
+    if not path.exists():
+        return {}, {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}, {}
+    if not isinstance(data, dict):
+        return {}, {}
+    if "tokens" not in data:
+        return _str_map(data), {}
+    return _str_map(data.get("tokens")), _str_map(data.get("horizons"))
+
+
+def _save_sync_state(tokens: Dict[str, str], horizons: Dict[str, str]) -> None:
+    path = _sync_state_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps({"tokens": tokens, "horizons": horizons}, sort_keys=True),
+        encoding="utf-8",
+    )
+
+
+def _list_request(
+    service: Any,
+    cal_id: str,
+    tmin: str,
+    tmax: str,
+    token: str | None,
+    sync_token: str | None = None,
+) -> Any:
+    if sync_token:
+        # Sync requests reject time bounds and ordering; the delta is filtered
+        # against the window locally.
+        return service.events().list(
+            calendarId=cal_id,
+            singleEvents=True,
+            maxResults=2500,
+            pageToken=token,
+            syncToken=sync_token,
+            fields=_EVENT_FIELDS,
+        )
+    kwargs: Dict[str, Any] = {}
+    if not SETTINGS.cal_incremental_sync:
+        # The full sync seeding a sync token omits orderBy like the sync
+        # requests that follow it.
+        kwargs["orderBy"] = "startTime"
+    return service.events().list(
+        calendarId=cal_id,
+        timeMin=tmin,
+        timeMax=tmax,
+        singleEvents=True,
+        maxResults=2500,
+        pageToken=token,
+        fields=_EVENT_FIELDS,
+        **kwargs,
+    )
+
+
+def _batch_first_pages(
+    service: Any,
+    cal_ids: List[str],
+    tmin: str,
+    tmax: str,
+    sync_tokens: Dict[str, str] | None = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Fetch the first event page of every calendar in one batch round-trip.
+
+    Calendars whose part of the batch failed are left out and fetched
+    individually with the regular retry policy.
+    """
+    sync_tokens = sync_tokens or {}
+    try:
+        responses = _execute_batch(
+            service,
+            [
+                _list_request(service, cal_id, tmin, tmax, None, sync_tokens.get(cal_id))
+                for cal_id in cal_ids
+            ],
+        )
+    except Exception as exc:
+        log_step("calendar", "events_batch_failed", {"error": str(exc)}, severity="warning")
+        return {}
+    return {
+        cal_id: resp
+        for cal_id, (resp, exc) in zip(cal_ids, responses)
+        if exc is None and resp is not None
+    }
+
+
+def _iter_event_pages(
+    service: Any,
+    cal_id: str,
+    tmin: str,
+    tmax: str,
+    first_page: Dict[str, Any] | None = None,
+    sync_token: str | None = None,
+    next_sync_tokens: Dict[str, str] | None = None,
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield the raw ``items`` of each result page of ``cal_id``.
+
+    ``first_page`` is an already fetched first response (see
+    :func:`_batch_first_pages`). Each response is dropped before the next page
+    is requested so only one decoded page is alive at a time. The last page's
+    ``nextSyncToken`` is stored in ``next_sync_tokens`` when given.
+    """
+    token = None
+    resp = first_page
+    while True:
+        if resp is None:
+            resp = _with_retry(
+                _list_request(service, cal_id, tmin, tmax, token, sync_token).execute,
+                "events_retry",
+                {"calendar_id": cal_id},
+            )
+        token = resp.get("nextPageToken")
+        if next_sync_tokens is not None and resp.get("nextSyncToken"):
+            next_sync_tokens[cal_id] = resp["nextSyncToken"]
+        items = resp.get("items") or []
+        resp = None
+        yield items
+        if not token:
+            break
+
+
+def _event_bound(value: Any) -> dt.datetime | None:
+    if not isinstance(value, dict):
+        return None
+    raw = value.get("dateTime") or value.get("date")
+    if not raw:
+        return None
+    try:
+        parsed = dt.datetime.fromisoformat(raw)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=dt.timezone.utc)
+
+
+def _in_window(item: Dict[str, Any], tmin: dt.datetime, tmax: dt.datetime) -> bool:
+    """Apply the API's timeMin/timeMax semantics to an item of a sync delta."""
+    if item.get("status") == "cancelled":
+        return False
+    start = _event_bound(item.get("start"))
+    if start is None:
+        return True
+    end = _event_bound(item.get("end")) or start
+    return end > tmin and start < tmax
+
+
+def _iter_normalized(
+    cal_id: str,
+    pages: Iterator[List[Dict[str, Any]]],
+    window: tuple[dt.datetime, dt.datetime] | None = None,
+) -> Iterator[Normalized]:
+    """Normalize the events of ``pages``, keeping only ``window`` when given."""
+    # Loop invariants are bound to locals once per calendar.
+    debug_events = SETTINGS.cal_debug_event_logging
+    normalize = _normalize
+    tmin, tmax = window if window is not None else (None, None)
+    for items in pages:
+        event_ids: List[str | None] = []
+        add_id = event_ids.append
+        for item in items:
+            if tmin is not None and not _in_window(item, tmin, tmax):
+                continue
+            norm = normalize(item, cal_id)
+            event_id = norm["event_id"]
+            add_id(event_id)
+            if debug_events:
+                log_step(
+                    "calendar",
+                    "event_ingested",
+                    {"event_id": event_id, "calendar_id": cal_id},
+                )
+            # ``_normalize`` returns a fresh dict; one copy serves as payload.
+            norm["payload"] = dict(norm)
+            yield norm
+        if event_ids:
+            log_step(
+                "calendar",
+                "page_ingested",
+                {
+                    "calendar_id": cal_id,
+                    "count": len(event_ids),
+                    "first": event_ids[:3],
+                    "last": event_ids[-3:],
+                },
+            )
+
+
+def _iter_calendar_events(
+    service: Any,
+    cal_id: str,
+    tmin: str,
+    tmax: str,
+    first_page: Dict[str, Any] | None = None,
+    sync_token: str | None = None,
+    next_sync_tokens: Dict[str, str] | None = None,
+    horizon: str | None = None,
+) -> Iterator[Normalized]:
+    """Yield the normalized events of ``cal_id`` within the window, page by page.
+
+    With a ``sync_token`` only events changed since the previous sync are
+    fetched. Changes outside the window are dropped from the delta, so the
+    slice between ``horizon`` (the previous ``timeMax``) and ``tmax`` is
+    fetched in full: events entering the window are picked up even when they
+    did not change. A token that expired before anything was yielded falls
+    back to a full fetch of the window.
+    """
+    if sync_token and horizon:
+        window = (dt.datetime.fromisoformat(tmin), dt.datetime.fromisoformat(tmax))
+        pages = _iter_event_pages(
+            service, cal_id, tmin, tmax, first_page, sync_token, next_sync_tokens
+        )
+        seen: set[str | None] = set()
+        try:
+            for norm in _iter_normalized(cal_id, pages, window):
+                seen.add(norm["event_id"])
+                yield norm
+        except Exception as exc:
+            if seen or _http_status(exc) != 410:
+                raise
+        else:
+            slice_min = max(horizon, tmin, key=dt.datetime.fromisoformat)
+            if dt.datetime.fromisoformat(slice_min) < window[1]:
+                # The slice's own sync token is not recorded; the delta's is.
+                pages = _iter_event_pages(service, cal_id, slice_min, tmax)
+                for norm in _iter_normalized(cal_id, pages):
+                    if norm["event_id"] not in seen:
+                        yield norm
+            return
+        log_step("calendar", "sync_token_expired", {"calendar_id": cal_id}, severity="info")
+        first_page = None
+    pages = _iter_event_pages(service, cal_id, tmin, tmax, first_page, None, next_sync_tokens)
+    yield from _iter_normalized(cal_id, pages)
+
+
+def _fetch_one_calendar(
+    service: Any,
+    cal_id: str,
+    tmin: str,
+    tmax: str,
+    first_page: Dict[str, Any] | None = None,
+    sync_token: str | None = None,
+    next_sync_tokens: Dict[str, str] | None = None,
+    horizon: str | None = None,
+) -> List[Normalized]:
+    """Fetch and normalize every event page of ``cal_id`` within the window."""
+    return list(
+        _iter_calendar_events(
+            service, cal_id, tmin, tmax, first_page, sync_token, next_sync_tokens, horizon
+        )
+    )
+
+
+def iter_events() -> Iterator[Normalized]:
+    """Yield normalized events of all configured calendars as they arrive.
+
+    A single calendar is streamed page by page; with several calendars each
+    one is yielded, in configured order, once its worker finished. Failures
+    are logged as ``fetch_error`` and end the iteration.
+    """
     if not build or not Credentials:
         log_step("calendar", "google_api_client_missing", {}, severity="error")
         if SETTINGS.live_mode == 1:
             raise RuntimeError("google_api_client_missing")
-        return results
+        return
+    client_id = SETTINGS.google_client_id
+    cid_tail = (client_id or "")[-8:]
     try:
         creds = build_user_credentials(SCOPES)
         if not creds:
@@ -122,119 +612,127 @@ def fetch_events() -> List[Normalized]:
                 {"mode": "v2-only"},
                 severity="error",
             )
-            return []
-
-        if all(
-            getattr(SETTINGS, a, None)
-            for a in (
-                "google_client_id",
-                "google_client_secret",
-                "google_refresh_token",
-            )
+            return
+
+        creds, service = _cached_service(creds)
+        # The cached credentials keep their token until it is about to expire.
+        if (
+            client_id
+            and SETTINGS.google_client_secret
+            and SETTINGS.google_refresh_token
+            and not getattr(creds, "valid", False)
         ):
             try:
-                creds.token = refresh_access_token()
+                creds.token, expires_at = refresh_access_token_with_expiry()
             except OAuthError:
+                _SERVICE_CACHE.clear()
                 log_step(
                     "calendar",
                     "google_invalid_grant",
                     {"message": "Refresh token rejected"},
                     severity="error",
                 )
-                return []
-
-        service = build("calendar", "v3", credentials=creds, cache_discovery=False)
+                return
+            # The token may come from the OAuth cache, so its real expiry is
+            # used; google-auth compares naive UTC expiries.
+            creds.expiry = dt.datetime.fromtimestamp(expires_at, dt.timezone.utc).replace(
+                tzinfo=None
+            )
 
         # Use test-facing CAL_IDS (can be monkeypatched)
         cal_ids: List[str] = CAL_IDS or ["primary"]
 
-        for attempt in range(1, MAX_ATTEMPTS + 1):
-            try:
-                service.calendarList().get(calendarId=cal_ids[0]).execute()
-                break
-            except Exception as e:
-                if attempt >= MAX_ATTEMPTS:
-                    code, hint = classify_oauth_error(e)
-                    cid_tail = (SETTINGS.google_client_id or "")[-8:]
-                    log_step(
-                        "calendar",
-                        "fetch_error",
-                        {
-                            "error": str(e),
-                            "code": code,
-                            "hint": hint,
-                            "client_id_tail": cid_tail,
-                        },
-                        severity="error",
-                    )
-                    return []
-                delay = backoff_seconds(attempt)
-                log_step(
-                    "calendar",
-                    "calendar_list_retry",
-                    {
-                        "calendar_id": cal_ids[0],
-                        "attempt": attempt,
-                        "backoff_seconds": round(delay, 2),
-                    },
-                    severity="warning",
-                )
-                time.sleep(delay)
+        def _probe() -> Dict[str, Exception]:
+            failed = _probe_calendars(service, cal_ids)
+            if len(failed) == len(cal_ids):
+                raise failed[cal_ids[0]]
+            return failed
+
+        # A final failure propagates to the handler below, which logs fetch_error.
+        failed = _with_retry(_probe, "calendar_list_retry", {"calendar_id": cal_ids[0]})
+
+        for cal_id, exc in failed.items():
+            log_step(
+                "calendar",
+                "calendar_unreachable",
+                {"calendar_id": cal_id, "error": str(exc)},
+                severity="warning",
+            )
+        cal_ids = [cal_id for cal_id in cal_ids if cal_id not in failed]
 
         tmin, tmax = _time_window()
-        for cal_id in cal_ids:
-            token = None
-            while True:
-                for attempt in range(1, MAX_ATTEMPTS + 1):
-                    try:
-                        resp = (
-                            service.events()
-                            .list(
-                                calendarId=cal_id,
-                                timeMin=tmin,
-                                timeMax=tmax,
-                                singleEvents=True,
-                                orderBy="startTime",
-                                maxResults=2500,
-                                pageToken=token,
-                            )
-                            .execute()
-                        )
-                        break
-                    except Exception as exc:
-                        if attempt >= MAX_ATTEMPTS:
-                            raise
-                        delay = backoff_seconds(attempt)
-                        log_step(
-                            "calendar",
-                            "events_retry",
-                            {
-                                "calendar_id": cal_id,
-                                "attempt": attempt,
-                                "backoff_seconds": round(delay, 2),
-                                "error": str(exc),
-                            },
-                            severity="warning",
-                        )
-                        time.sleep(delay)
-                for item in resp.get("items", []):
-                    norm = _normalize(item, cal_id)
-                    log_step(
-                        "calendar",
-                        "event_ingested",
-                        {"event_id": norm.get("event_id"), "calendar_id": cal_id},
-                    )
-                    ev = dict(norm)
-                    ev["payload"] = dict(norm)
-                    results.append(ev)
-                token = resp.get("nextPageToken")
-                if not token:
-                    break
-
-        log_step("calendar", "fetch_ok", {"calendars": cal_ids, "count": len(results)})
+        sync_tokens: Dict[str, str] = {}
+        horizons: Dict[str, str] = {}
+        if SETTINGS.cal_incremental_sync:
+            sync_tokens, horizons = _load_sync_state()
+            # Without a known horizon the delta cannot tell which events
+            # entered the window since, so such calendars are fetched in full.
+            sync_tokens = {c: t for c, t in sync_tokens.items() if c in horizons}
+        next_sync_tokens: Dict[str, str] | None = (
+            {} if SETTINGS.cal_incremental_sync else None
+        )
+        count = 0
+        if len(cal_ids) == 1:
+            for event in _iter_calendar_events(
+                service,
+                cal_ids[0],
+                tmin,
+                tmax,
+                sync_token=sync_tokens.get(cal_ids[0]),
+                next_sync_tokens=next_sync_tokens,
+                horizon=horizons.get(cal_ids[0]),
+            ):
+                count += 1
+                yield event
+        else:
+            first_pages = _batch_first_pages(service, cal_ids, tmin, tmax, sync_tokens)
+
+            # httplib2 transports are not thread-safe, so every worker thread
+            # keeps its own service; results keep the configured calendar order.
+            def _fetch(cal_id: str) -> List[Normalized]:
+                first_page = first_pages.get(cal_id)
+                sync_token = sync_tokens.get(cal_id)
+                # Synced calendars fetch the newly entered window slice as well.
+                if (
+                    first_page is not None
+                    and not first_page.get("nextPageToken")
+                    and not sync_token
+                ):
+                    worker_service = None
+                else:
+                    worker_service = _worker_service(creds)
+                return _fetch_one_calendar(
+                    worker_service,
+                    cal_id,
+                    tmin,
+                    tmax,
+                    first_page,
+                    sync_token,
+                    next_sync_tokens,
+                    horizons.get(cal_id),
+                )
+
+            # Each worker runs in a copy of this context so its log records
+            # join a surrounding ``buffered_log_steps`` block.
+            contexts = [contextvars.copy_context() for _ in cal_ids]
+            for events in _fetch_pool().map(
+                lambda ctx, cal_id: ctx.run(_fetch, cal_id), contexts, cal_ids
+            ):
+                count += len(events)
+                yield from events
+
+        if next_sync_tokens:
+            # Every calendar with a fresh token was read completely up to tmax.
+            _save_sync_state(
+                {**sync_tokens, **next_sync_tokens},
+                {**horizons, **dict.fromkeys(next_sync_tokens, tmax)},
+            )
+
+        log_step("calendar", "fetch_ok", {"calendars": cal_ids, "count": count})
     except Exception as e:  # pragma: no cover
+        # Drop the cached service so the next poll starts from fresh credentials.
+        _SERVICE_CACHE.clear()
         code, hint = classify_oauth_error(e)
-        cid_tail = (SETTINGS.google_client_id or "")[-8:]
         log_step(
             "calendar",
             "fetch_error",
@@ -246,4 +744,13 @@ def fetch_events() -> List[Normalized]:
             },
             severity="error",
         )
-    return results
+
+
+def fetch_events() -> List[Normalized]:
+    """Fetch and normalize events of all configured calendars.
+
+    Per-page and per-event log records are buffered and written once when the
+    fetch finishes.
+    """
+    with buffered_log_steps():
+        return list(iter_events())
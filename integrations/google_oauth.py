@@ -1,7 +1,7 @@
 """Google OAuth: requires GOOGLE_CLIENT_ID / GOOGLE_CLIENT_SECRET / GOOGLE_REFRESH_TOKEN."""
 from __future__ import annotations
 
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 
 import time
 
@@ -18,6 +18,16 @@ except Exception:
 
 DEFAULT_TOKEN_URI = "https://oauth2.googleapis.com/token"
 
+# Access tokens keyed by (token_uri, client_id, refresh_token) with their expiry
+# as a ``time.time()`` value; reused until ``_TOKEN_EXPIRY_MARGIN`` seconds
+# before Google expires them. The margin exceeds google-auth's own refresh
+# threshold so a handed-out token still counts as valid for ``Credentials``.
+_TOKEN_CACHE: Dict[Tuple[str, str, str], Tuple[str, float]] = {}
+_TOKEN_EXPIRY_MARGIN = 300
+
+# Shared session so token refreshes and their retries reuse one TLS connection.
+_SESSION = requests.Session()
+
 
 class OAuthError(Exception):
     """Raised when refreshing an OAuth token fails."""
@@ -62,6 +72,15 @@ def classify_oauth_error(err: Exception) -> Tuple[str, str]:
 
 
 def refresh_access_token() -> str:
+    return refresh_access_token_with_expiry()[0]
+
+
+def refresh_access_token_with_expiry() -> Tuple[str, float]:
+    """Return an access token and its expiry as a ``time.time()`` value.
+
+    The expiry is the one Google reported for the token, also when the token
+    comes from the cache.
+    """
     payload = {
         "client_id": getattr(SETTINGS, "google_client_id", ""),
         "client_secret": getattr(SETTINGS, "google_client_secret", ""),
@@ -69,11 +88,15 @@ def refresh_access_token() -> str:
         "grant_type": "refresh_token",
     }
     token_uri = getattr(SETTINGS, "google_token_uri", DEFAULT_TOKEN_URI)
+    cache_key = (token_uri, payload["client_id"], payload["refresh_token"])
+    cached = _TOKEN_CACHE.get(cache_key)
+    if cached and time.time() < cached[1] - _TOKEN_EXPIRY_MARGIN:
+        return cached
     response = None
     last_exc: Exception | None = None
     for attempt in range(1, MAX_ATTEMPTS + 1):
         try:
-            response = requests.post(token_uri, data=payload, timeout=30)
+            response = _SESSION.post(token_uri, data=payload, timeout=30)
         except requests.RequestException as exc:
             last_exc = exc
             if attempt >= MAX_ATTEMPTS:
@@ -146,8 +169,15 @@ def refresh_access_token() -> str:
             pass
         raise OAuthError("Google refresh token invalid_grant")
     r.raise_for_status()
-    token = r.json().get("access_token", "")
+    body = r.json()
+    token = body.get("access_token", "")
     if not token:
         raise OAuthError("No access_token in response")
+    try:
+        expires_in = float(body.get("expires_in") or 3600)
+    except (TypeError, ValueError):
+        expires_in = 3600.0
+    entry = (token, time.time() + expires_in)
+    _TOKEN_CACHE[cache_key] = entry
     log_step("oauth", "google_token_refreshed", {}, severity="info")
-    return token
+    return entry
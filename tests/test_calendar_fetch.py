@@ -8,6 +8,12 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 from integrations import google_calendar
 
 
+class _HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.resp = type("resp", (), {"status": status})()
+
+
 class _StubEvents:
     def __init__(self, pages, rec):
         self.pages = pages
@@ -24,41 +30,85 @@ class _StubEvents:
         return self.pages.get(key, {"items": []})
 
 
+class _StubBatch:
+    def __init__(self, callback):
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id=None):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self.requests:
+            try:
+                resp, exc = request.execute(), None
+            except Exception as err:
+                resp, exc = None, err
+            self.callback(request_id, resp, exc)
+
+
+class _Everything:
+    def __contains__(self, item):
+        return True
+
+
 class _StubService:
-    def __init__(self, pages, rec):
+    def __init__(self, pages, rec, unreachable=()):
         self.pages = pages
         self.rec = rec
+        self.unreachable = set(unreachable)
 
     def events(self):
         return _StubEvents(self.pages, self.rec)
 
-    class _CalList:
+    class _Calendars:
+        def __init__(self, unreachable):
+            self.unreachable = unreachable
+            self.cal_id = None
+
         def get(self, calendarId=None):
+            self.cal_id = calendarId
             return self
 
         def execute(self):
+            if self.cal_id in self.unreachable:
+                raise _HttpError(404, "notFound")
             return {}
 
+    def calendars(self):
+        return self._Calendars(self.unreachable)
+
     def calendarList(self):
-        return self._CalList()
+        # No configured calendar is on the user's calendar list.
+        return self._Calendars(_Everything())
+
+    def new_batch_http_request(self, callback=None):
+        return _StubBatch(callback)
+
+
+@pytest.fixture(autouse=True)
+def fresh_service_cache(monkeypatch):
+    monkeypatch.setattr(google_calendar, "_SERVICE_CACHE", {})
 
 
 @pytest.fixture
 def stub_time(monkeypatch):
-    fixed = dt.datetime(2024, 1, 1)
+    fixed = dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc)
 
     class _FixedDateTime(dt.datetime):
         @classmethod
-        def utcnow(cls):
-            return fixed
+        def now(cls, tz=None):
+            return fixed.astimezone(tz) if tz else fixed.replace(tzinfo=None)
 
     monkeypatch.setattr(google_calendar.dt, "datetime", _FixedDateTime)
-    return fixed
+    google_calendar._time_window_cached.cache_clear()
+    yield fixed
+    google_calendar._time_window_cached.cache_clear()
 
 
-def _setup_service(monkeypatch, pages):
+def _setup_service(monkeypatch, pages, unreachable=()):
     rec = []
-    svc = _StubService(pages, rec)
+    svc = _StubService(pages, rec, unreachable)
     monkeypatch.setattr(google_calendar, "build", lambda *a, **k: svc)
     monkeypatch.setattr(google_calendar, "build_user_credentials", lambda scopes: object())
     return rec
@@ -71,6 +121,7 @@ def test_time_window_defaults(monkeypatch, stub_time, tmp_path):
     args = rec[0]
     assert args["timeMin"] == "2023-12-31T00:00:00+00:00"
     assert args["timeMax"] == "2024-01-15T00:00:00+00:00"
+    assert args["fields"] == google_calendar._EVENT_FIELDS
 
 
 def test_env_override(monkeypatch, stub_time, tmp_path):
@@ -107,3 +158,366 @@ def test_multi_calendar_and_pagination(monkeypatch, stub_time, tmp_path):
     fetch_logs = [l for l in logs if l["status"] == "fetch_ok"]
     assert fetch_logs and fetch_logs[0]["payload"]["calendars"] == ["cal1", "cal2"]
 
+
+
+def test_ingestion_logged_once_per_page(monkeypatch, stub_time, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    pages = {
+        ("primary", None): {"items": [{"id": "1"}, {"id": "2"}], "nextPageToken": "t"},
+        ("primary", "t"): {"items": [{"id": "3"}]},
+    }
+    _setup_service(monkeypatch, pages)
+    logs = []
+
+    def fake_log_step(category, status, payload, severity="info"):
+        logs.append({"status": status, "payload": payload})
+
+    monkeypatch.setattr(google_calendar, "log_step", fake_log_step)
+    google_calendar.fetch_events()
+    assert not [l for l in logs if l["status"] == "event_ingested"]
+    pages_logged = [l["payload"] for l in logs if l["status"] == "page_ingested"]
+    assert [p["count"] for p in pages_logged] == [2, 1]
+    assert pages_logged[0]["first"] == ["1", "2"]
+
+
+def test_unreachable_calendar_is_skipped(monkeypatch, stub_time, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    pages = {
+        ("cal1", None): {"items": [{"id": "1"}]},
+        ("cal2", None): {"items": [{"id": "2"}]},
+    }
+    monkeypatch.setattr(google_calendar, "CAL_IDS", ["cal1", "cal2"])
+    rec = _setup_service(monkeypatch, pages, unreachable={"cal1"})
+    logs = []
+
+    def fake_log_step(category, status, payload, severity="info"):
+        logs.append({"status": status, "payload": payload})
+
+    monkeypatch.setattr(google_calendar, "log_step", fake_log_step)
+    res = google_calendar.fetch_events()
+    assert [e["event_id"] for e in res] == ["2"]
+    assert [r["calendarId"] for r in rec] == ["cal2"]
+    assert any(
+        l["status"] == "calendar_unreachable" and l["payload"]["calendar_id"] == "cal1"
+        for l in logs
+    )
+
+
+def test_transient_probe_failure_still_fetches_calendar(monkeypatch, stub_time, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    pages = {
+        ("cal1", None): {"items": [{"id": "1"}]},
+        ("cal2", None): {"items": [{"id": "2"}]},
+        ("cal3", None): {"items": [{"id": "3"}]},
+    }
+    monkeypatch.setattr(google_calendar, "CAL_IDS", ["cal1", "cal2", "cal3"])
+    rec = _setup_service(monkeypatch, pages)
+    failures = {
+        "cal1": _HttpError(429, "rateLimitExceeded"),
+        "cal2": _HttpError(403, "userRateLimitExceeded"),
+        "cal3": _HttpError(503, "backendError"),
+    }
+
+    def flaky_probe(self):
+        raise failures[self.cal_id]
+
+    monkeypatch.setattr(_StubService._Calendars, "execute", flaky_probe)
+    res = google_calendar.fetch_events()
+    assert [e["event_id"] for e in res] == ["1", "2", "3"]
+    assert [r["calendarId"] for r in rec] == ["cal1", "cal2", "cal3"]
+
+
+def test_calendar_missing_from_calendar_list_is_fetched(monkeypatch, stub_time, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    pages = {
+        ("primary", None): {"items": [{"id": "1"}]},
+        ("room@resource.calendar.google.com", None): {"items": [{"id": "2"}]},
+    }
+    monkeypatch.setattr(
+        google_calendar, "CAL_IDS", ["primary", "room@resource.calendar.google.com"]
+    )
+    rec = _setup_service(monkeypatch, pages)
+    svc = google_calendar.build()
+    # A resource calendar shared by ID is not on the user's calendar list,
+    # but its events are readable.
+    with pytest.raises(_HttpError):
+        svc.calendarList().get(calendarId="room@resource.calendar.google.com").execute()
+    res = google_calendar.fetch_events()
+    assert [e["event_id"] for e in res] == ["1", "2"]
+    assert [r["calendarId"] for r in rec] == ["primary", "room@resource.calendar.google.com"]
+
+
+def test_forbidden_calendar_is_skipped(monkeypatch, stub_time, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    pages = {
+        ("cal1", None): {"items": [{"id": "1"}]},
+        ("cal2", None): {"items": [{"id": "2"}]},
+    }
+    monkeypatch.setattr(google_calendar, "CAL_IDS", ["cal1", "cal2"])
+    _setup_service(monkeypatch, pages)
+
+    def probe(self):
+        if self.cal_id == "cal1":
+            raise _HttpError(403, "forbidden")
+        return {}
+
+    monkeypatch.setattr(_StubService._Calendars, "execute", probe)
+    res = google_calendar.fetch_events()
+    assert [e["event_id"] for e in res] == ["2"]
+
+
+def test_events_list_is_retried(monkeypatch, stub_time, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    rec = _setup_service(monkeypatch, {("primary", None): {"items": [{"id": "1"}]}})
+    original = _StubEvents.execute
+    calls = {"n": 0}
+
+    def flaky_execute(self):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise RuntimeError("backendError")
+        return original(self)
+
+    monkeypatch.setattr(_StubEvents, "execute", flaky_execute)
+    monkeypatch.setattr(google_calendar.time, "sleep", lambda s: None)
+    logs = []
+    monkeypatch.setattr(
+        google_calendar,
+        "log_step",
+        lambda category, status, payload, severity="info": logs.append((status, payload)),
+    )
+    res = google_calendar.fetch_events()
+    assert [e["event_id"] for e in res] == ["1"]
+    retries = [p for s, p in logs if s == "events_retry"]
+    assert len(retries) == 1 and retries[0]["attempt"] == 1
+    # The request is built once and its execute() retried.
+    assert [r["calendarId"] for r in rec] == ["primary"]
+    assert calls["n"] == 2
+
+
+def test_first_pages_are_batched(monkeypatch, stub_time, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    pages = {
+        ("cal1", None): {"items": [{"id": "1"}], "nextPageToken": "t"},
+        ("cal1", "t"): {"items": [{"id": "2"}]},
+        ("cal2", None): {"items": [{"id": "3"}]},
+    }
+    monkeypatch.setattr(google_calendar, "CAL_IDS", ["cal1", "cal2"])
+    rec = []
+    svc = _StubService(pages, rec)
+    builds = []
+
+    def fake_build(*a, **k):
+        builds.append(k)
+        return svc
+
+    monkeypatch.setattr(google_calendar, "build", fake_build)
+    monkeypatch.setattr(google_calendar, "build_user_credentials", lambda scopes: object())
+    res = google_calendar.fetch_events()
+    assert [e["event_id"] for e in res] == ["1", "2", "3"]
+    assert [(r["calendarId"], r.get("pageToken")) for r in rec] == [
+        ("cal1", None),
+        ("cal2", None),
+        ("cal1", "t"),
+    ]
+    # cal2 fits into its batched first page, so only cal1 needs a worker service.
+    assert len(builds) == 2
+
+
+def test_service_is_reused_across_polls(monkeypatch, stub_time, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    svc = _StubService({("primary", None): {"items": [{"id": "1"}]}}, [])
+    builds = []
+
+    def fake_build(*a, **k):
+        builds.append(k)
+        return svc
+
+    monkeypatch.setattr(google_calendar, "build", fake_build)
+    monkeypatch.setattr(google_calendar, "build_user_credentials", lambda scopes: object())
+    assert [e["event_id"] for e in google_calendar.fetch_events()] == ["1"]
+    assert [e["event_id"] for e in google_calendar.fetch_events()] == ["1"]
+    assert len(builds) == 1
+
+
+def test_worker_services_are_reused_across_polls(monkeypatch, stub_time, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    pages = {
+        ("cal1", None): {"items": [{"id": "1"}], "nextPageToken": "t"},
+        ("cal1", "t"): {"items": [{"id": "2"}]},
+    }
+    monkeypatch.setattr(google_calendar, "CAL_IDS", ["cal1", "cal2"])
+    monkeypatch.setattr(google_calendar, "_MAX_FETCH_WORKERS", 1)
+    monkeypatch.setattr(google_calendar, "_FETCH_POOL", None)
+    svc = _StubService(pages, [])
+    builds = []
+
+    def fake_build(*a, **k):
+        builds.append(k)
+        return svc
+
+    monkeypatch.setattr(google_calendar, "build", fake_build)
+    monkeypatch.setattr(google_calendar, "build_user_credentials", lambda scopes: object())
+    for _ in range(2):
+        res = google_calendar.fetch_events()
+        assert [e["event_id"] for e in res] == ["1", "2"]
+    # One main service plus one service for the single worker thread.
+    assert len(builds) == 2
+    google_calendar._FETCH_POOL.shutdown()
+
+
+class _Gone(Exception):
+    class resp:
+        status = 410
+
+
+class _SyncStubEvents(_StubEvents):
+    def execute(self):
+        if self.kw.get("syncToken") == "expired":
+            raise _Gone("sync token expired")
+        if self.kw.get("syncToken"):
+            return {
+                "items": [
+                    {"id": "changed", "start": {"dateTime": "2024-01-02T10:00:00Z"}},
+                    {"id": "gone", "status": "cancelled"},
+                    {"id": "later", "start": {"date": "2024-06-01"}},
+                ],
+                "nextSyncToken": "s2",
+            }
+        if self.kw.get("timeMin", "") > "2024-01-01":
+            # Window slice that entered since the previous sync.
+            return {
+                "items": [
+                    {"id": "later", "start": {"date": "2024-06-01"}},
+                    {"id": "unchanged", "start": {"date": "2024-06-02"}},
+                ],
+                "nextSyncToken": "slice",
+            }
+        return {"items": [{"id": "1"}], "nextSyncToken": "s1"}
+
+
+def _setup_sync_service(monkeypatch, tmp_path):
+    from config.settings import SETTINGS
+
+    monkeypatch.setattr(SETTINGS, "cal_incremental_sync", True)
+    monkeypatch.setattr(SETTINGS, "workflows_dir", tmp_path)
+    rec = []
+    svc = _StubService({}, rec)
+    svc.events = lambda: _SyncStubEvents({}, rec)
+    monkeypatch.setattr(google_calendar, "build", lambda *a, **k: svc)
+    monkeypatch.setattr(google_calendar, "build_user_credentials", lambda scopes: object())
+    return rec
+
+
+def _advance_time(monkeypatch, when):
+    class _LaterDateTime(dt.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return when.astimezone(tz) if tz else when.replace(tzinfo=None)
+
+    monkeypatch.setattr(google_calendar.dt, "datetime", _LaterDateTime)
+    google_calendar._time_window_cached.cache_clear()
+
+
+def test_incremental_sync_uses_stored_token(monkeypatch, stub_time, tmp_path):
+    rec = _setup_sync_service(monkeypatch, tmp_path)
+    assert [e["event_id"] for e in google_calendar.fetch_events()] == ["1"]
+    assert "orderBy" not in rec[0]
+    tokens, horizons = google_calendar._load_sync_state()
+    assert tokens == {"primary": "s1"}
+    assert horizons == {"primary": "2024-01-15T00:00:00+00:00"}
+
+    del rec[:]
+    res = google_calendar.fetch_events()
+    assert rec[0]["syncToken"] == "s1" and "timeMin" not in rec[0]
+    # The window has not moved, so no slice is fetched; cancelled and
+    # out-of-window changes are dropped from the delta.
+    assert len(rec) == 1
+    assert [e["event_id"] for e in res] == ["changed"]
+    assert google_calendar._load_sync_state()[0] == {"primary": "s2"}
+
+
+def test_incremental_sync_picks_up_events_entering_window(monkeypatch, stub_time, tmp_path):
+    rec = _setup_sync_service(monkeypatch, tmp_path)
+    google_calendar.fetch_events()
+    _advance_time(monkeypatch, dt.datetime(2024, 5, 25, tzinfo=dt.timezone.utc))
+
+    del rec[:]
+    res = google_calendar.fetch_events()
+    assert rec[0]["syncToken"] == "s1"
+    assert rec[1]["timeMin"] == "2024-05-24T00:00:00+00:00"
+    assert rec[1]["timeMax"] == "2024-06-08T00:00:00+00:00"
+    # "later" changed out of window earlier and is now released once, together
+    # with the unchanged event that entered the window.
+    assert [e["event_id"] for e in res] == ["later", "unchanged"]
+    tokens, horizons = google_calendar._load_sync_state()
+    assert tokens == {"primary": "s2"}
+    assert horizons == {"primary": "2024-06-08T00:00:00+00:00"}
+
+
+def test_sync_token_without_horizon_fetches_full_window(monkeypatch, stub_time, tmp_path):
+    rec = _setup_sync_service(monkeypatch, tmp_path)
+    # State written before horizons were recorded.
+    (tmp_path / "calendar_sync.json").write_text('{"primary": "s1"}', encoding="utf-8")
+    res = google_calendar.fetch_events()
+    assert [e["event_id"] for e in res] == ["1"]
+    assert [r.get("syncToken") for r in rec] == [None]
+
+
+def test_expired_sync_token_falls_back_to_full_fetch(monkeypatch, stub_time, tmp_path):
+    rec = _setup_sync_service(monkeypatch, tmp_path)
+    google_calendar._save_sync_state(
+        {"primary": "expired"}, {"primary": "2024-01-15T00:00:00+00:00"}
+    )
+    monkeypatch.setattr(google_calendar.time, "sleep", lambda s: None)
+    res = google_calendar.fetch_events()
+    assert [e["event_id"] for e in res] == ["1"]
+    assert [r.get("syncToken") for r in rec] == ["expired", None]
+    assert google_calendar._load_sync_state()[0] == {"primary": "s1"}
+
+
+def test_iter_events_streams_pages(monkeypatch, stub_time, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    pages = {
+        ("primary", None): {"items": [{"id": "1"}], "nextPageToken": "t"},
+        ("primary", "t"): {"items": [{"id": "2"}]},
+    }
+    rec = _setup_service(monkeypatch, pages)
+    events = google_calendar.iter_events()
+    assert next(events)["event_id"] == "1"
+    assert [r.get("pageToken") for r in rec] == [None]
+    assert [e["event_id"] for e in events] == ["2"]
+    assert [r.get("pageToken") for r in rec] == [None, "t"]
+
+
+def test_access_token_refreshed_only_when_expired(monkeypatch, stub_time, tmp_path):
+    from config.settings import SETTINGS
+
+    class _Creds:
+        token = None
+        expiry = None
+
+        @property
+        def valid(self):
+            now = google_calendar.dt.datetime.now(dt.timezone.utc).replace(tzinfo=None)
+            return bool(self.token) and self.expiry is not None and now < self.expiry
+
+    monkeypatch.chdir(tmp_path)
+    _setup_service(monkeypatch, {})
+    monkeypatch.setattr(google_calendar, "build_user_credentials", lambda scopes: _Creds())
+    monkeypatch.setattr(SETTINGS, "google_client_id", "cid")
+    monkeypatch.setattr(SETTINGS, "google_client_secret", "secret")
+    monkeypatch.setattr(SETTINGS, "google_refresh_token", "refresh")
+    refreshed = []
+    # A cached token reported to expire in ten minutes, not a fresh hour.
+    expires_at = stub_time.timestamp() + 600
+    monkeypatch.setattr(
+        google_calendar,
+        "refresh_access_token_with_expiry",
+        lambda: refreshed.append(1) or ("tok", expires_at),
+    )
+    google_calendar.fetch_events()
+    google_calendar.fetch_events()
+    assert len(refreshed) == 1
+    creds = google_calendar._SERVICE_CACHE["creds"]
+    assert creds.expiry == dt.datetime(2024, 1, 1, 0, 10)
@@ -15,3 +15,89 @@ def test_normalize_extracts_company_and_domain():
     norm = google_calendar._normalize(ev, "primary")
     assert norm["company_name"] == "ACME GmbH"
     assert norm["domain"] == "acme.com"
+
+
+def test_extract_company_memoizes_short_texts():
+    google_calendar._extract_company_cached.cache_clear()
+    text = "Q3 review: Initech GmbH"
+    assert google_calendar.extract_company(text) == "Initech GmbH"
+    assert google_calendar.extract_company(text) == "Initech GmbH"
+    assert google_calendar._extract_company_cached.cache_info().hits == 1
+
+    long_text = ("x" * google_calendar._EXTRACT_CACHE_MAX_LEN) + ": Initech GmbH"
+    assert google_calendar.extract_company(long_text) == "Initech GmbH"
+    assert google_calendar._extract_company_cached.cache_info().currsize == 1
+
+
+def test_extract_skips_regex_without_suffix_or_dot():
+    google_calendar._extract_company_cached.cache_clear()
+    google_calendar._extract_domain_cached.cache_clear()
+    assert google_calendar.extract_company("Weekly sync with Initech") is None
+    assert google_calendar.extract_domain("Weekly sync") is None
+    assert google_calendar._extract_company_cached.cache_info().misses == 0
+    assert google_calendar._extract_domain_cached.cache_info().misses == 0
+
+
+def test_normalize_prefers_summary_and_does_not_join_fields():
+    ev = {
+        "id": "2",
+        "summary": "Visit Globex AG at globex.example",
+        "description": "Follow-up with ACME GmbH",
+    }
+    norm = google_calendar._normalize(ev, "primary")
+    assert norm["company_name"] == "Visit Globex AG"
+    assert norm["domain"] == "globex.example"
+
+    ev = {"id": "3", "summary": "Kickoff Initech", "description": "GmbH details"}
+    assert google_calendar._normalize(ev, "primary")["company_name"] is None
+
+
+def test_public_calendar_api_is_exposed():
+    # core.services, core.triggers and tests import these from the one module.
+    for name in ("fetch_events", "iter_events", "contains_trigger", "extract_company", "extract_domain"):
+        assert callable(getattr(google_calendar, name))
+
+
+def test_normalize_creator_and_organizer_emails():
+    ev = {"id": "4", "creator": {"email": "a@example.com"}, "organizer": {}}
+    norm = google_calendar._normalize(ev, "primary")
+    assert norm["creatorEmail"] == "a@example.com"
+    assert norm["creator"] == {"email": "a@example.com"}
+    assert norm["organizerEmail"] is None
+    assert norm["organizer"] == {}
+    assert google_calendar._normalize({"id": "5"}, "primary")["creatorEmail"] is None
+
+
+def test_contains_trigger_picks_up_edited_trigger_file(tmp_path, monkeypatch):
+    import os
+
+    from config.settings import SETTINGS
+
+    words = tmp_path / "trigger_words.txt"
+    words.write_text("alpha\n", encoding="utf-8")
+    monkeypatch.setattr(SETTINGS, "trigger_words_path", words)
+    assert google_calendar.contains_trigger("Alpha review")
+    assert not google_calendar.contains_trigger("Beta review")
+
+    words.write_text("beta\n", encoding="utf-8")
+    stat = words.stat()
+    os.utime(words, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert google_calendar.contains_trigger("Beta review")
+    assert not google_calendar.contains_trigger("Alpha review")
+
+
+def test_normalized_events_do_not_share_attendee_entries():
+    ev = {"id": "6", "attendees": [{"email": "a@example.com"}]}
+    first = google_calendar._normalize(ev, "primary")
+    second = google_calendar._normalize(dict(ev, id="7"), "primary")
+    first["attendees"][0]["name"] = "Alice"
+    assert second["attendees"] == [{"email": "a@example.com"}]
+
+
+def test_extraction_does_not_split_words_at_umlauts():
+    google_calendar._extract_company_cached.cache_clear()
+    google_calendar._extract_domain_cached.cache_clear()
+    assert google_calendar.extract_domain("Größe.de") is None
+    assert google_calendar.extract_domain("müller-bau.de") != "ller-bau.de"
+    assert google_calendar.extract_domain("bäckerei-schmidt.de") != "ckerei-schmidt.de"
+    assert google_calendar.extract_company("ÖKO Tech GmbH") != "KO Tech GmbH"
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from pathlib import Path
 
@@ -58,6 +60,9 @@ def test_customer_meeting_synonym():
     triggers = load_trigger_words()
     ev = {"summary": "Customer-Meeting with ACME"}
     assert contains_trigger(ev, triggers)
+    # Cached result is shared, so it must be immutable.
+    assert isinstance(triggers, tuple)
+    assert load_trigger_words() is triggers
 
 
 def test_custom_trigger_file(tmp_path, monkeypatch):
@@ -77,3 +82,102 @@ def test_custom_trigger_file(tmp_path, monkeypatch):
     # Cleanup
     if safe_path.exists():
         safe_path.unlink()
+
+
+def test_extract_company_ai_is_cached(tmp_path, monkeypatch):
+    from core import trigger_words as tw
+
+    calls = []
+    clients = []
+
+    class _Completions:
+        def create(self, **kwargs):
+            calls.append(kwargs)
+            msg = type("Msg", (), {"content": "ACME"})
+            choice = type("Choice", (), {"message": msg})
+            return type("Resp", (), {"choices": [choice]})
+
+    class _Client:
+        chat = type("Chat", (), {"completions": _Completions()})
+
+        def __init__(self, **kwargs):
+            clients.append(kwargs)
+
+    monkeypatch.setattr(tw, "openai", type("OpenAI", (), {"OpenAI": _Client}))
+    monkeypatch.setattr(SETTINGS, "llm_cache_dir", tmp_path / "llm", raising=False)
+    tw._extract_company_ai.cache_clear()
+
+    assert tw.extract_company("ACME research", "research") == "ACME"
+    assert tw.extract_company("ACME research", "research") == "ACME"
+    assert len(calls) == 1
+
+    tw._extract_company_ai.cache_clear()
+    assert tw.extract_company("ACME research", "research") == "ACME"
+    assert len(calls) == 1
+    entries = list((tmp_path / "llm").glob("*.json"))
+    assert len(entries) == 1
+    assert json.loads(entries[0].read_text(encoding="utf-8"))["prompt_version"] == tw._PROMPT_VERSION
+    assert not list((tmp_path / "llm").glob("*.tmp"))
+    assert "max_tokens" not in calls[0]
+    assert tw.extract_company("Initech research", "research") == "ACME"
+    assert len(calls) == 2
+    assert len(clients) == 1
+    tw._extract_company_ai.cache_clear()
+    tw._openai_client.cache_clear()
+
+
+def test_exact_match_automaton_respects_word_boundaries(monkeypatch):
+    import core.trigger_words as tw
+
+    triggers = ("research", "customer-meeting")
+    cases = {
+        "Company research today": True,
+        "customer-meeting: ACME": True,
+        "researcher sync": False,
+        "preresearch notes": False,
+    }
+    for text, expected in cases.items():
+        assert tw._exact_match(text, triggers) is expected
+    monkeypatch.setattr(tw, "_ahocorasick", None)
+    tw._trigger_automaton.cache_clear()
+    for text, expected in cases.items():
+        assert tw._exact_match(text, triggers) is expected
+    # The alternation backtracks to a longer trigger when a prefix fails \b.
+    assert tw._exact_match("researcher sync", ("research", "researcher"))
+    tw._trigger_automaton.cache_clear()
+    tw._trigger_pattern.cache_clear()
+
+
+def test_trigger_words_reload_when_file_changes(tmp_path, monkeypatch):
+    import os
+
+    import core.trigger_words as tw
+
+    words = tmp_path / "trigger_words.txt"
+    words.write_text("research\n", encoding="utf-8")
+    monkeypatch.setattr(tw, "_trigger_words_file", lambda: words)
+    monkeypatch.setattr(tw, "_TRIGGER_FILE_STAMP", None)
+    tw.load_trigger_words.cache_clear()
+    tw._get_normalized_triggers.cache_clear()
+    try:
+        tw.reload_trigger_words_if_changed()
+        assert tw._get_normalized_triggers() == ("research",)
+
+        words.write_text("briefing\n", encoding="utf-8")
+        stat = words.stat()
+        os.utime(words, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        tw.reload_trigger_words_if_changed()
+        assert tw._get_normalized_triggers() == ("briefing",)
+    finally:
+        tw.load_trigger_words.cache_clear()
+        tw._get_normalized_triggers.cache_clear()
+
+
+def test_suggest_similar_normalizes_triggers_once():
+    import core.trigger_words as tw
+
+    tw._normalized_pairs.cache_clear()
+    assert suggest_similar("planning rserch tomorrow") == ["research"]
+    assert suggest_similar("customer reserch") == ["research"]
+    info = tw._normalized_pairs.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
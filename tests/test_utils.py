@@ -13,3 +13,59 @@ def test_contains_trigger_true():
 def test_contains_trigger_false():
     assert not contains_trigger("Irrelevantes Meeting")
 
+
+def test_buffered_log_steps_write_once(tmp_path, monkeypatch):
+    import json
+
+    from config.settings import SETTINGS
+    from core import utils
+
+    monkeypatch.setattr(SETTINGS, "workflows_dir", tmp_path)
+    log = tmp_path / "calendar.jsonl"
+    with utils.buffered_log_steps():
+        utils.log_step("calendar", "page_ingested", {"count": 1})
+        with utils.buffered_log_steps():
+            utils.log_step("calendar", "page_ingested", {"count": 2})
+        assert not log.exists()
+    records = [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+    assert [r["count"] for r in records] == [1, 2]
+    utils.log_step("calendar", "fetch_ok", {})
+    assert len(log.read_text(encoding="utf-8").splitlines()) == 3
+
+
+def test_normalize_text_ascii_fast_path_matches_full_path():
+    from core.utils import normalize_text
+
+    assert normalize_text("Customer-Meeting ACME") == "customer-meeting acme"
+    assert normalize_text("Geschäftskunde – Besuch") == "geschaeftskunde - besuch"
+
+
+def test_buffered_log_steps_only_buffer_current_context(tmp_path, monkeypatch):
+    import contextvars
+    import threading
+
+    from config.settings import SETTINGS
+    from core import utils
+
+    monkeypatch.setattr(SETTINGS, "workflows_dir", tmp_path)
+    log = tmp_path / "calendar.jsonl"
+
+    def _lines():
+        return log.read_text(encoding="utf-8").count("\n") if log.exists() else 0
+
+    with utils.buffered_log_steps():
+        other = threading.Thread(target=utils.log_step, args=("calendar", "other", {}))
+        other.start()
+        other.join()
+        # A thread outside the block writes through immediately.
+        assert _lines() == 1
+
+        joined = threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(utils.log_step, "calendar", "worker", {}),
+        )
+        joined.start()
+        joined.join()
+        utils.log_step("calendar", "main", {})
+        assert _lines() == 1
+    assert _lines() == 3
@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+
+from integrations import google_oauth
+
+
+def _settings(monkeypatch, refresh_token="rt"):
+    monkeypatch.setattr(google_oauth.SETTINGS, "google_client_id", "id", raising=False)
+    monkeypatch.setattr(google_oauth.SETTINGS, "google_client_secret", "sec", raising=False)
+    monkeypatch.setattr(google_oauth.SETTINGS, "google_refresh_token", refresh_token, raising=False)
+    monkeypatch.setattr(google_oauth, "log_step", lambda *a, **k: None)
+
+
+def test_refresh_access_token_reuses_unexpired_token(monkeypatch):
+    _settings(monkeypatch)
+    monkeypatch.setattr(google_oauth, "_TOKEN_CACHE", {})
+    posts = []
+
+    def fake_post(url, data=None, timeout=None):
+        posts.append(data["refresh_token"])
+        return SimpleNamespace(
+            status_code=200,
+            text="",
+            raise_for_status=lambda: None,
+            json=lambda: {"access_token": f"tok{len(posts)}", "expires_in": 3599},
+        )
+
+    monkeypatch.setattr(google_oauth._SESSION, "post", fake_post)
+    assert google_oauth.refresh_access_token() == "tok1"
+    assert google_oauth.refresh_access_token() == "tok1"
+    assert posts == ["rt"]
+
+    # A different refresh token never sees the cached access token.
+    _settings(monkeypatch, refresh_token="rt2")
+    assert google_oauth.refresh_access_token() == "tok2"
+
+    # Tokens about to expire are refreshed.
+    now = google_oauth.time.time()
+    monkeypatch.setattr(google_oauth.time, "time", lambda: now + 3599)
+    assert google_oauth.refresh_access_token() == "tok3"
+    assert posts == ["rt", "rt2", "rt2"]
+
+
+def test_refresh_access_token_with_expiry_reports_cached_expiry(monkeypatch):
+    _settings(monkeypatch)
+    monkeypatch.setattr(google_oauth, "_TOKEN_CACHE", {})
+    now = google_oauth.time.time()
+    monkeypatch.setattr(google_oauth.time, "time", lambda: now)
+    monkeypatch.setattr(
+        google_oauth._SESSION,
+        "post",
+        lambda url, data=None, timeout=None: SimpleNamespace(
+            status_code=200,
+            text="",
+            raise_for_status=lambda: None,
+            json=lambda: {"access_token": "tok", "expires_in": 3599},
+        ),
+    )
+    assert google_oauth.refresh_access_token_with_expiry() == ("tok", now + 3599)
+
+    # Half an hour later the cached token keeps its original expiry.
+    monkeypatch.setattr(google_oauth.time, "time", lambda: now + 1800)
+    assert google_oauth.refresh_access_token_with_expiry() == ("tok", now + 3599)
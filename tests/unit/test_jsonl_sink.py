@@ -1,15 +1,7 @@
 from pathlib import Path
 import json
 
-import importlib.util
-
-_spec = importlib.util.spec_from_file_location(
-    "jsonl_sink", Path(__file__).resolve().parents[2] / "a2a_logging" / "jsonl_sink.py"
-)
-_mod = importlib.util.module_from_spec(_spec)
-assert _spec and _spec.loader
-_spec.loader.exec_module(_mod)
-append = _mod.append
+from a2a_logging.jsonl_sink import append
 
 
 def test_append(tmp_path: Path) -> None:
@@ -19,3 +11,10 @@ def test_append(tmp_path: Path) -> None:
     lines = file.read_text().splitlines()
     assert json.loads(lines[0])["a"] == 1
     assert json.loads(lines[1])["b"] == 2
+
+
+def test_append_matches_json_dumps_format(tmp_path: Path) -> None:
+    file = tmp_path / "log.jsonl"
+    record = {"status": "geschäftskunde", "n": 1}
+    append(file, record)
+    assert file.read_text(encoding="utf-8") == json.dumps(record, ensure_ascii=False) + "\n"
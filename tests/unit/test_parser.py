@@ -0,0 +1,15 @@
+from core import parser
+
+
+def test_extract_all_matches_individual_extractors():
+    text = "Firma: ACME GmbH\nWeb acme.example, Tel +49 30 1234567"
+    assert parser.extract_all(text) == {
+        "company": parser.extract_company(text),
+        "domain": parser.extract_domain(text),
+        "phone": parser.extract_phone(text),
+    }
+
+
+def test_extract_all_omits_missing_fields():
+    assert parser.extract_all("no details here") == {}
+    assert parser.extract_all("") == {}